@@ -12,7 +12,7 @@ import operator as op
 import re
 from collections.abc import Callable
 from dataclasses import dataclass
-from functools import cache
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypeAlias
 
@@ -29,6 +29,7 @@ if TYPE_CHECKING:
 VarOptions: TypeAlias = list[str] | Callable[[], list[str]] | None
 
 _DISPLAY_LABEL_SEP = re.compile(r"_|(?=[A-Z])")
+_split_label = _DISPLAY_LABEL_SEP.split
 
 
 def get_vars_group(doc: Document | None = None) -> DocumentObject:
@@ -544,26 +545,31 @@ def import_variables(path: str | Path, doc: Document | None = None) -> bool:
     return True
 
 
-@cache
 def var_display_label(group: str, name: str) -> str:
     """Get the display label for a variable."""
+    return _var_display_label(group.lower(), name)
+
+
+@lru_cache(maxsize=4096)
+def _var_display_label(group: str, name: str) -> str:
     if preferences.raw_name_labels():
         return name
-    if name.lower().startswith(group.lower()):
+    if name.lower().startswith(group):
         name = name[len(group) :]
-    return display_label(name)
+    if "_" not in name and name.islower():
+        # Common case: plain lowercase names need no regex split.
+        return name.capitalize()
+    return " ".join(filter(None, _split_label(name))).title()
 
 
 @cache
 def display_label(name: str) -> str:
     """Get the display label for a group/variable."""
-    if preferences.raw_name_labels():
-        return name
-    try:
-        parts = [p for p in _DISPLAY_LABEL_SEP.split(name) if p]
-        return " ".join(p.capitalize() for p in parts)
-    except Exception:  # noqa: BLE001
+    if not isinstance(name, str) or preferences.raw_name_labels():
         return name
+    if "_" not in name and name.islower():
+        return name.capitalize()
+    return " ".join(filter(None, _split_label(name))).title()
 
 
 class Variable:
@@ -824,7 +830,7 @@ class Variable:
 
     @property
     def var_label(self) -> str:
-        return var_display_label(self.group, self.name)
+        return _var_display_label(self.group.lower(), self.name)
 
     @property
     def group_label(self) -> str:
@@ -7,11 +7,13 @@ FreeCAD Vars: Editors UI.
 
 from __future__ import annotations
 
-import contextlib
+import re
 from contextlib import suppress
-from itertools import chain
-from textwrap import dedent, shorten
-from typing import TYPE_CHECKING
+from functools import cached_property, lru_cache, partial
+from textwrap import dedent
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, ClassVar
+from weakref import WeakKeyDictionary, WeakSet, WeakValueDictionary
 
 import FreeCAD as App  # type: ignore
 
@@ -23,6 +25,7 @@ from freecad.vars.api import (
     display_label,
     export_variables,
     get_groups,
+    get_vars,
     import_variables,
 )
 from freecad.vars.config import preferences, resources
@@ -42,31 +45,54 @@ if TYPE_CHECKING:
     from collections.abc import Callable, Generator
 
     from FreeCAD import Document, DocumentObject  # type: ignore
-    from PySide6.QtCore import QEvent, QObject, QSettings, QTimer
+    from PySide6.QtCore import (
+        QAbstractTableModel,
+        QEvent,
+        QModelIndex,
+        QObject,
+        QSettings,
+        QSignalBlocker,
+        QTimer,
+    )
     from PySide6.QtWidgets import (
         QAbstractSpinBox,
         QApplication,
         QCompleter,
         QGraphicsOpacityEffect,
+        QHeaderView,
         QMenu,
         QSlider,
+        QTableView,
     )
 
 if not TYPE_CHECKING:
-    from PySide.QtCore import QEvent, QObject, QSettings, QTimer
+    from PySide.QtCore import (
+        QAbstractTableModel,
+        QEvent,
+        QModelIndex,
+        QObject,
+        QSettings,
+        QSignalBlocker,
+        QTimer,
+    )
     from PySide.QtGui import (
         QAbstractSpinBox,
         QApplication,
         QCompleter,
         QGraphicsOpacityEffect,
+        QHeaderView,
         QMenu,
         QSlider,
+        QTableView,
     )
 
 style_vars = {
     "border_color": TEXT_COLOR,
 }
 
+# interpolate_style_vars substitutes all keys in one compiled-regex pass.
+# str.format_map would need every qss rule brace escaped, so it is not
+# used here.
 stylesheet = interpolate_style_vars(
     """
     QFrame[varEditorFocus="off"] {
@@ -83,12 +109,112 @@ stylesheet = interpolate_style_vars(
         margin: 0px;
     }
 
+    *[varEditorRole="label"] {
+        font-weight: bold;
+    }
+
+    *[varEditorRole="menu"]::menu-indicator {
+        image: none;
+    }
+
+    *[varEditorRole="descIcon"] {
+        margin-left: 5px;
+    }
+
+    *[varEditorRole="description"] {
+        padding-left: 5px;
+        padding-top: 5px;
+    }
+
     """,
     style_vars,
 )
 
 
-def set_visibility(widget: ui.QWidget, visibility: bool) -> None:
+@lru_cache(maxsize=512)
+def _tr(source: str) -> str:
+    """
+    Memoized translation of static "Vars" context strings.
+
+    Page constructors resolve the same strings over and over, so the
+    translation lookup is paid once per string. Call ``_tr.cache_clear()``
+    if the application language changes at runtime.
+
+    :param source: The source string to translate.
+    :return: The translated string.
+    """
+    return str(dtr("Vars", source))
+
+
+@lru_cache(maxsize=64)
+def _icon(name: str) -> ui.QIcon:
+    """
+    Get a cached FlatIcon by resource name.
+
+    Icons are immutable, so each SVG is read and colorized only once
+    per session instead of once per widget construction.
+
+    :param name: The icon resource file name.
+    :return: The cached icon.
+    """
+    return FlatIcon(resources.icon(name))
+
+
+def _short(text: str, width: int, placeholder: str = " ...") -> str:
+    """
+    Truncate text at a word boundary.
+
+    Slice-based replacement for textwrap.shorten, which tokenizes the
+    whole string; descriptions are truncated per editor row build.
+    """
+    if len(text) <= width:
+        return text
+    cut = text.rfind(" ", 0, width - len(placeholder) + 1)
+    if cut <= 0:
+        cut = width - len(placeholder)
+    return text[:cut] + placeholder
+
+
+_TOOLTIP_EVENT_INT = int(QEvent.Type.ToolTip)
+
+
+class _LazyToolTip(QObject):
+    """
+    Install a computed tooltip on first hover instead of at build time.
+
+    Building the tooltip text costs dedent/shorten/format work per editor,
+    which is wasted for the rows the user never hovers.
+    """
+
+    def __init__(self, compute: Callable[[], str], parent: QObject) -> None:
+        super().__init__(parent)
+        self._compute = compute
+        self._text: str | None = None
+        self._widgets: list[ui.QWidget] = []
+
+    def attach(self, widget: ui.QWidget) -> None:
+        self._widgets.append(widget)
+        widget.installEventFilter(self)
+
+    def invalidate(self) -> None:
+        self._text = None
+        for widget in self._widgets:
+            widget.setToolTip("")
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        if int(event.type()) == _TOOLTIP_EVENT_INT and not obj.toolTip():
+            if self._text is None:
+                self._text = self._compute()
+            obj.setToolTip(self._text)
+        return False
+
+
+def set_visibility(
+    widget: ui.QWidget,
+    visibility: bool,
+    *,
+    use_cached_height: bool = False,
+) -> None:
     """
     Set the visibility of the widget using height to avoid widget destroy.
 
@@ -97,9 +223,17 @@ def set_visibility(widget: ui.QWidget, visibility: bool) -> None:
 
     :param widget: The widget to set the visibility for.
     :param visibility: The visibility of the widget.
+    :param use_cached_height: Reuse the last computed size hint. Only safe
+        for widgets whose content height is stable, like editor rows;
+        sizeHint() is a layout traversal Qt does not memoize.
     """
     if visibility:
-        widget.setFixedHeight(widget.sizeHint().height())
+        height = getattr(widget, "_cached_height", 0) if use_cached_height else 0
+        if not height:
+            height = widget.sizeHint().height()
+            if use_cached_height:
+                widget._cached_height = height  # noqa: SLF001
+        widget.setFixedHeight(height)
         widget.setEnabled(True)
     else:
         widget.setFixedHeight(0)
@@ -139,7 +273,7 @@ def add_action(
     """
     action = ui.QAction(str(text), parent)
     if icon:
-        action.setIcon(FlatIcon(resources.icon(icon)))
+        action.setIcon(_icon(icon))
     if tooltip:
         action.setToolTip(str(tooltip))
     if shortcut:
@@ -155,7 +289,7 @@ class VarEditor(QObject):
 
     variable: Variable
     label: ui.InputTextWidget
-    description: ui.QLabel
+    description: ui.QLabel | None
     editor: ui.InputQuantityWidget
     widget: ui.QWidget
     event_bus: EventBus
@@ -183,6 +317,7 @@ class VarEditor(QObject):
             raise ValueError(msg)
 
         self.variable = variable
+        self._name_lower = variable.name.lower()
         self.event_bus = event_bus
         self.description_visible = bool(preferences.show_descriptions() and variable.description)
         self.lock_event_filter = LockEventFilter(self)
@@ -198,7 +333,7 @@ class VarEditor(QObject):
             self.widget = box
             self.setParent(box)
             box.varInstance = self
-            tooltip = self.var_tooltip()
+            self._tooltip = _LazyToolTip(self.var_tooltip, self)
             with ui.Col(contentsMargins=(2, 0, 2, 0), spacing=0):
                 with ui.Row(contentsMargins=(0, 0, 0, 0), spacing=0) as row:
                     self.row_layout = row.layout()
@@ -206,49 +341,59 @@ class VarEditor(QObject):
                         variable.var_label,
                         readOnly=True,
                         focusPolicy=ui.Qt.FocusPolicy.ClickFocus,
-                        stretch=_UI_CACHE.get("LabelColumnStretch", 45),
-                        styleSheet="font-weight: bold;",
-                        toolTip=tooltip,
+                        stretch=_UI_CACHE.label_column_stretch,
+                        properties={"varEditorRole": "label"},
                         cursorPosition=0,
                     )
-                    self.create_input_editor(tooltip)
+                    self.create_input_editor()
                     self.create_menu_button()
+                    self._tooltip.attach(self.label)
+                    self._tooltip.attach(self.editor)
 
-            self.create_description(box)
-            self.install_focus_style_listener()
+            self.create_description()
 
-        self.event_bus.column_width_change.connect(self.on_column_width_changed)
+        self.event_bus.column_width_change.connect(
+            self.on_column_width_changed,
+            ui.Qt.ConnectionType.DirectConnection,
+        )
 
     def on_column_width_changed(self, value: int) -> None:
         self.row_layout.setStretchFactor(self.label, value)
         self.row_layout.setStretchFactor(self.editor, 100 - value)
 
-    def install_focus_style_listener(self) -> None:
-        ui.QApplication.instance().focusChanged.connect(self.on_focus_change)
-
-    def create_description(self, parent: ui.QWidget) -> None:
-        opacity = QGraphicsOpacityEffect(parent, opacity=0.5)
-        with ui.Container(contentsMargins=(0, 0, 0, 0), visible=self.description_visible):
+    def set_focus_style(self, on: bool) -> None:
+        widget = self.widget
+        widget.setProperty("varEditorFocus", "on" if on else "off")
+        widget.style().polish(widget)
+
+    def create_description(self) -> None:
+        # Editors without a visible description skip the whole sub-row,
+        # including the graphics effects, which are pure overhead there.
+        if not self.description_visible:
+            self.desc_icon = None
+            self.description = None
+            return
+        with ui.Container(contentsMargins=(0, 0, 0, 0)):
             with ui.Row(contentsMargins=(1, 0, 0, 5), spacing=0):
                 self.desc_icon = ui.IconLabel(
-                    icon=FlatIcon(resources.icon("child-arrow.svg")),
-                    graphicsEffect=opacity,
-                    styleSheet="margin-left: 5px;",
+                    icon=_icon("child-arrow.svg"),
+                    graphicsEffect=QGraphicsOpacityEffect(opacity=0.5),
+                    properties={"varEditorRole": "descIcon"},
                     alignment=ui.Qt.AlignmentFlag.AlignTop,
                 )
                 self.description = ui.TextLabel(
-                    shorten(self.variable.description, 160, placeholder=" ..."),
+                    _short(self.variable.description, 160),
                     sizePolicy=(
                         ui.QSizePolicy.Policy.Preferred,
                         ui.QSizePolicy.Policy.MinimumExpanding,
                     ),
                     wordWrap=True,
-                    graphicsEffect=opacity,
+                    graphicsEffect=QGraphicsOpacityEffect(opacity=0.5),
                     stretch=1,
-                    styleSheet="padding-left: 5px; padding-top: 5px;",
+                    properties={"varEditorRole": "description"},
                 )
 
-    def create_input_editor(self, tooltip: str) -> ui.QWidget:
+    def create_input_editor(self) -> ui.QWidget:
         variable = self.variable
         if prop_info := PROPERTY_INFO.get(variable.var_type):
             widget_type = prop_info.editor
@@ -265,17 +410,16 @@ class VarEditor(QObject):
                 prop_name="Value",
                 accessor_adapter=accessor_adapter,
                 objectName=f"VarEditor_{variable.internal_name}",
-                stretch=100 - _UI_CACHE.get("LabelColumnStretch", 45),
+                stretch=100 - _UI_CACHE.label_column_stretch,
             )
         else:
             self.editor = ui.InputQuantity(
                 obj=variable.varset,
                 property="Value",
                 auto_apply=True,
-                stretch=100 - _UI_CACHE.get("LabelColumnStretch", 45),
+                stretch=100 - _UI_CACHE.label_column_stretch,
                 widget_type=widget_type,
                 name=f"VarEditor_{variable.internal_name}",
-                toolTip=tooltip,
                 accessor_adapter=accessor_adapter,
             )
 
@@ -285,8 +429,11 @@ class VarEditor(QObject):
             lambda _: self.event_bus.variable_changed.emit(variable),
         )
 
-        self.event_bus.variable_changed.connect(self.silent_value_update)
-        self.event_bus.var_renamed.connect(self.ui_update)
+        # Single-threaded UI: direct connections skip Qt's per-emit
+        # auto connection-type resolution for these high-fanout slots.
+        direct = ui.Qt.ConnectionType.DirectConnection
+        self.event_bus.variable_changed.connect(self.silent_value_update, direct)
+        self.event_bus.register_editor(self)
 
         self.lock_ui(variable.read_only)
         self.update_visibility_ui()
@@ -297,7 +444,7 @@ class VarEditor(QObject):
     def lock_ui(self, lock: bool = True) -> None:
         if lock:
             self.lock_event_filter.install(self.editor)
-            icon = FlatIcon(resources.icon("locked.svg"))
+            icon = _icon("locked.svg")
             setattr(  # noqa: B010
                 self.label,
                 "_lock_icon",
@@ -312,7 +459,7 @@ class VarEditor(QObject):
     def update_visibility_ui(self) -> None:
         hidden = self.variable.hidden
         if hidden:
-            icon = FlatIcon(resources.icon("hidden_ind.svg"))
+            icon = _icon("hidden_ind.svg")
             setattr(  # noqa: B010
                 self.label,
                 "_hidden_icon",
@@ -327,8 +474,8 @@ class VarEditor(QObject):
         if getattr(self.label, "_warning", None):
             return
         action = ui.QAction(
-            icon=FlatIcon(resources.icon("warning.svg")),
-            toolTip=str(dtr("Vars", "Invalid value")),
+            icon=_icon("warning.svg"),
+            toolTip=_tr("Invalid value"),
         )
         self.label.addAction(action, ui.QLineEdit.ActionPosition.TrailingPosition)
         self.label._warning = action  # noqa: SLF001
@@ -340,22 +487,28 @@ class VarEditor(QObject):
 
     def ui_update(self, var: Variable) -> None:
         if var == self.variable:
+            self._name_lower = var.name.lower()
+            self.widget._cached_height = 0  # noqa: SLF001
             self.label.setText(var.var_label)
-            self.label.setToolTip(self.var_tooltip())
-            self.description.setText(var.description)
+            self._tooltip.invalidate()
+            if self.description is not None:
+                self.description.setText(var.description)
+                # Longer text can wrap to more lines: re-measure the row
+                # now that the cached height was dropped.
+                if is_visible(self.widget):
+                    set_visibility(self.widget, True, use_cached_height=True)
             self.update_visibility_ui()
             self.silent_value_update(var)
 
     def silent_value_update(self, var: Variable) -> None:
         if var != self.variable:
-            self.editor.blockSignals(True)
-            self.editor.setValue(self.variable.value)
-            self.editor.blockSignals(False)
+            with QSignalBlocker(self.editor):
+                self.editor.setValue(self.variable.value)
 
     def var_tooltip(self) -> str:
         var = self.variable
         return dedent(f"""
-            <p>{var.name}: {shorten(var.description, 255, placeholder="...")}</p>
+            <p>{var.name}: {_short(var.description, 255, placeholder="...")}</p>
             <pre>Type: {var.var_type}
             Reference: &lt;&lt;{var.name}&gt;&gt;.Value
             Python: freecad.vars.api.get_var("{var.name}", doc)</pre>
@@ -368,7 +521,7 @@ class VarEditor(QObject):
             popupMode=ui.QToolButton.ToolButtonPopupMode.InstantPopup,
             arrowType=ui.Qt.ArrowType.NoArrow,
             toolButtonStyle=ui.Qt.ToolButtonStyle.ToolButtonTextOnly,
-            styleSheet="QToolButton::menu-indicator { image: none; }",
+            properties={"varEditorRole": "menu"},
             focusPolicy=ui.Qt.FocusPolicy.NoFocus,
             clicked=self.popup_menu,
         )
@@ -474,11 +627,13 @@ class VarEditor(QObject):
         self.variable.reorder(1)
         self.event_bus.var_reordered.emit(self)
 
-    def filter(self, text: str, show_hidden: bool = False) -> None:
-        if not text or text.lower() in self.variable.name.lower():
-            set_visibility(self.widget, (not self.variable.hidden) or show_hidden)
-            return
-        set_visibility(self.widget, False)
+    def filter(self, text: str, show_hidden: bool = False) -> bool:
+        """Apply the lowercased filter text and report the resulting visibility."""
+        visible = (not text or text in self._name_lower) and (
+            (not self.variable.hidden) or show_hidden
+        )
+        set_visibility(self.widget, visible, use_cached_height=True)
+        return visible
 
     def cmd_lock(self) -> None:
         read_only = not self.variable.read_only
@@ -503,29 +658,21 @@ class VarEditor(QObject):
     def cmd_delete(self) -> None:
         self.event_bus.goto_delete_var.emit(self.variable)
 
-    def on_focus_change(self, old: ui.QWidget, new: ui.QWidget) -> None:
-        is_parent_of_old = old and self.widget.isAncestorOf(old)
-        is_parent_of_new = new and self.widget.isAncestorOf(new)
-
-        if not (is_parent_of_old and is_parent_of_new):
-            if is_parent_of_old:
-                parent = self.widget
-                parent.setProperty("varEditorFocus", "off")
-                parent.style().unpolish(parent)
-                parent.style().polish(parent)
-            elif is_parent_of_new:
-                parent = self.widget
-                parent.setProperty("varEditorFocus", "on")
-                parent.style().unpolish(parent)
-                parent.style().polish(parent)
-
-        if next_widget := getattr(new, "forwardFocusTo", None):
-            next_widget.setFocus()
-
     def __lt__(self, other: VarEditor) -> bool:
         return self.variable < other.variable
 
 
+def _find_var_editor(widget: ui.QWidget | None) -> VarEditor | None:
+    """Walk up the parent chain to the owning editor row, if any."""
+    while widget is not None:
+        if (editor := getattr(widget, "varInstance", None)) is not None:
+            return editor
+        widget = widget.parentWidget()
+    return None
+
+
+
+
 class EventBus(QObject):
     """Event bus for async inter-object communication."""
 
@@ -540,6 +687,7 @@ class EventBus(QObject):
     variable_changed = ui.Signal(Variable)
 
     var_renamed = ui.Signal(Variable)
+    var_metadata_changed = ui.Signal(Variable)
     var_delete_requested = ui.Signal(Variable)
     var_editor_removed = ui.Signal(Variable)
     var_created = ui.Signal(Variable)
@@ -558,16 +706,40 @@ class EventBus(QObject):
 
     def __init__(self, *args) -> None:  # noqa: D107
         super().__init__(*args)
+        # Rename/metadata updates target exactly one editor, so they are
+        # routed by key instead of broadcast to every connected editor.
+        self._editors_by_key: WeakValueDictionary[str, VarEditor] = WeakValueDictionary()
+        direct = ui.Qt.ConnectionType.DirectConnection
+        self.var_renamed.connect(self._dispatch_ui_update, direct)
+        self.var_metadata_changed.connect(self._dispatch_ui_update, direct)
+
+    def register_editor(self, editor: VarEditor) -> None:
+        """Index an editor by its variable's stable internal name."""
+        self._editors_by_key[editor.variable.internal_name] = editor
+
+    def find_value_widget(self, object_name: str) -> ui.QWidget | None:
+        """Resolve a VarEditor_* object name without a widget-tree walk."""
+        editor = self._editors_by_key.get(object_name.removeprefix("VarEditor_"))
+        return editor.editor if editor else None
+
+    def _dispatch_ui_update(self, var: Variable) -> None:
+        if editor := self._editors_by_key.get(var.internal_name):
+            editor.ui_update(var)
 
 
 class VarGroupSection(QObject):
     """Variable group section."""
 
     name: str
-    editors: list[VarEditor]
+    editors: dict[str, VarEditor]
     container: ui.QWidget
     editors_layout: ui.QLayout
     event_bus: EventBus
+    _pending_vars: list[Variable] | None
+
+    # Approximate collapsed row height used to reserve scroll space
+    # for sections whose editors are not materialized yet.
+    ROW_HEIGHT_HINT = 28
 
     def __init__(
         self,
@@ -581,30 +753,71 @@ class VarGroupSection(QObject):
         self.name = name
         self.event_bus = event_bus
 
+        # Group names are free user text; hashing keeps quotes and brackets
+        # out of the objectName and the qss selector.
+        box_id = f"VarsGroupBox_{hash(name)}"
         with ui.GroupBox(
             title=display_label(name),
             contentsMargins=(2, 2, 2, 2),
-            objectName=f"VarsGroupBox{hash(name)}",
-            styleSheet=f"QGroupBox[objectName='VarsGroupBox{hash(name)}'] {{margin-bottom: 20;}}",
+            objectName=box_id,
+            styleSheet=f"QGroupBox[objectName='{box_id}'] {{margin-bottom: 20;}}",
             add=add,
         ) as box:
             self.container = box
             box.groupInstance = self
             with ui.Col(contentsMargins=(2, 2, 2, 2), spacing=0) as col:
                 self.editors_layout = col.layout()
-                self.editors = [
-                    VarEditor(var, event_bus, parent=self) for var in variables if var.group == name
-                ]
+                self.editors = {}
+                # Callers pass the group's own variables, already bucketed.
+                self._pending_vars = list(variables)
+                box.setFixedHeight(self._estimated_height())
+
+        direct = ui.Qt.ConnectionType.DirectConnection
+        event_bus.var_delete_requested.connect(self.on_delete_requested, direct)
+        event_bus.var_reordered.connect(self.on_var_reordered, direct)
+        event_bus.var_group_will_change.connect(self.remove_var_editor, direct)
+
+    @property
+    def loaded(self) -> bool:
+        return self._pending_vars is None
 
-        event_bus.var_delete_requested.connect(self.on_delete_requested)
-        event_bus.var_reordered.connect(self.on_var_reordered)
-        event_bus.var_group_will_change.connect(self.remove_var_editor)
+    def _estimated_height(self) -> int:
+        return self.ROW_HEIGHT_HINT * (len(self._pending_vars) + 1)
+
+    def ensure_loaded(self) -> None:
+        """
+        Materialize the variable editors on first use.
+
+        Editor construction is deferred until the section scrolls into
+        view, so dialog open time scales with the visible sections only.
+        """
+        if self._pending_vars is None:
+            return
+        variables, self._pending_vars = self._pending_vars, None
+        self.container.setUpdatesEnabled(False)
+        try:
+            ui.build_context().reset()
+            make = partial(VarEditor, event_bus=self.event_bus, add=False, parent=self)
+            self.editors = {var.internal_name: make(var) for var in variables}
+            layout = self.editors_layout
+            for editor in self.editors.values():
+                layout.addWidget(editor.widget)
+            ui.build_context().reset()
+            self.container.setMinimumHeight(0)
+            self.container.setMaximumHeight(16777215)
+            layout.activate()
+        finally:
+            self.container.setUpdatesEnabled(True)
 
     def on_var_reordered(self, editor: VarEditor | None) -> None:
-        if editor is None or editor in self.editors:
-            self.editors.sort()
+        if self._pending_vars is not None:
+            self._pending_vars.sort()
+            return
+        if editor is None or editor.variable.internal_name in self.editors:
+            ordered = sorted(self.editors.values())
+            self.editors = {ed.variable.internal_name: ed for ed in ordered}
             layout = self.editors_layout
-            for ed in self.editors:
+            for ed in ordered:
                 layout.removeWidget(ed.widget)
                 layout.addWidget(ed.widget)
             layout.activate()
@@ -614,31 +827,55 @@ class VarGroupSection(QObject):
         self.event_bus.var_editor_removed.emit(var)
 
     def remove_var_editor(self, var: Variable) -> None:
-        editors = [e for e in self.editors if e.variable == var]
-        if editors:
-            editor = editors[0]
+        if self._pending_vars is not None:
+            self._pending_vars = [v for v in self._pending_vars if v != var]
+            return
+        if editor := self.editors.pop(var.internal_name, None):
             self.editors_layout.removeWidget(editor.widget)
-            self.editors.remove(editor)
             editor.widget.deleteLater()
             editor.deleteLater()
 
     def filter(self, text: str, show_hidden: bool = False) -> None:
+        text = text.lower()
+        if self._pending_vars is not None:
+            visible = any(
+                (not text or text in var.name.lower()) and ((not var.hidden) or show_hidden)
+                for var in self._pending_vars
+            )
+            if visible:
+                self.container.setFixedHeight(self._estimated_height())
+                self.container.setEnabled(True)
+            else:
+                self.container.setFixedHeight(0)
+                self.container.setEnabled(False)
+            return
         visible = False
-        for editor in self.editors:
-            editor.filter(text, show_hidden)
-            visible = visible or is_visible(editor.widget)
-        set_visibility(self.container, visible)
+        self.container.setUpdatesEnabled(False)
+        try:
+            for editor in self.editors.values():
+                visible = editor.filter(text, show_hidden) or visible
+            set_visibility(self.container, visible)
+        finally:
+            self.container.setUpdatesEnabled(True)
+
+    def add_variable_editor(self, var: Variable) -> str | None:
+        """
+        Add an editor for a new variable of this group.
+
+        The caller is responsible for batching: build context resets and
+        layout activation happen once per batch, not per insertion.
 
-    def add_variable_editor(self, var: Variable) -> None:
+        :param var: The new variable.
+        :return: The object name of the new value editor, or None.
+        """
+        self.ensure_loaded()
         if var.group == self.name:
-            ui.build_context().reset()
             editor = VarEditor(var, self.event_bus, add=False, parent=self)
-            self.editors.append(editor)
+            self.editors[var.internal_name] = editor
             self.editors_layout.addWidget(editor.widget)
-            ui.build_context().reset()
-            ui.QApplication.instance().processEvents()
             self.on_var_reordered(editor)
-            self.event_bus.request_focus.emit(editor.editor.objectName())
+            return editor.editor.objectName()
+        return None
 
 
 def toolbar_button(
@@ -657,7 +894,7 @@ def toolbar_button(
     :return: The created button.
     """
     return ui.Button(
-        icon=FlatIcon(resources.icon(icon)),
+        icon=_icon(icon),
         tool=True,
         toolButtonStyle=ui.Qt.ToolButtonStyle.ToolButtonIconOnly,
         focusPolicy=ui.Qt.FocusPolicy.NoFocus,
@@ -667,12 +904,28 @@ def toolbar_button(
     )
 
 
-@contextlib.contextmanager
-def ToolBar(*, stretch: bool = True) -> Generator[ui.QWidget, None, None]:
-    with ui.Row(contentsMargins=(0, 0, 0, 0), spacing=0) as row:
-        yield row
-        if stretch:
+class ToolBar:
+    """
+    Toolbar row builder.
+
+    A plain context handler: page builds create many of these and a
+    generator-based contextmanager allocates a frame per use.
+    """
+
+    __slots__ = ("_row", "_stretch")
+
+    def __init__(self, *, stretch: bool = True) -> None:
+        """Open the toolbar row, optionally without the trailing stretch."""
+        self._stretch = stretch
+        self._row = ui.Row(contentsMargins=(0, 0, 0, 0), spacing=0)
+
+    def __enter__(self) -> ui.QWidget:
+        return self._row.__enter__()
+
+    def __exit__(self, *exc: object) -> bool | None:
+        if exc[0] is None and self._stretch:
             ui.Stretch(1)
+        return self._row.__exit__(*exc)
 
 
 class UIPage(QObject):
@@ -736,15 +989,51 @@ class HomePage(UIPage):
                 self.scroll = scroll
                 bus.request_focus.connect(self.on_request_focus)
 
+        self._lazy_load_timer = QTimer(self)
+        self._lazy_load_timer.setSingleShot(True)
+        self._lazy_load_timer.setInterval(50)
+        self._lazy_load_timer.timeout.connect(self.load_visible_sections)
+        scrollbar = self.scroll.verticalScrollBar()
+        scrollbar.valueChanged.connect(self.on_scrolled)
+        # Filtering or resizing can bring skeleton sections into view
+        # without any scrolling (or remove the scrollbar entirely), so the
+        # range change must also trigger a visibility pass.
+        scrollbar.rangeChanged.connect(self.on_scroll_range_changed)
+        QTimer.singleShot(0, self.load_visible_sections)
+
         self.event_bus.variable_changed.connect(self.recompute)
         self.event_bus.reload_vars.connect(self.reload_content)
 
+    def on_scrolled(self, _value: int) -> None:
+        self._lazy_load_timer.start()
+
+    def on_scroll_range_changed(self, _min: int, _max: int) -> None:
+        self._lazy_load_timer.start()
+
+    def schedule_lazy_load(self) -> None:
+        """Re-check section visibility shortly, coalescing bursts."""
+        self._lazy_load_timer.start()
+
+    def load_visible_sections(self) -> None:
+        """Materialize editors of the sections currently intersecting the viewport."""
+        viewport = self.scroll.viewport()
+        height = viewport.height()
+        text = self.editor.search.text()
+        for section in self.editor.sections:
+            if section.loaded:
+                continue
+            container = section.container
+            top = container.mapTo(viewport, container.rect().topLeft()).y()
+            if top < height and top + container.height() > 0:
+                section.ensure_loaded()
+                section.filter(text, self.show_hidden)
+
     def create_column_slider(self) -> None:
         with ui.Row(contentsMargins=(10, 0, 40, 0)):
             slider = QSlider()
             slider.setMinimum(0)
             slider.setMaximum(100)
-            slider.setValue(_UI_CACHE.get("LabelColumnStretch", 45))
+            slider.setValue(_UI_CACHE.label_column_stretch)
             slider.setOrientation(ui.Qt.Orientation.Horizontal)
             slider.setTickPosition(QSlider.TickPosition.NoTicks)
             slider.setFocusPolicy(ui.Qt.FocusPolicy.NoFocus)
@@ -760,7 +1049,7 @@ class HomePage(UIPage):
         elif value > MAX:
             value = MAX
             self.column_slider.setValue(value)
-        _UI_CACHE["LabelColumnStretch"] = value
+        _UI_CACHE.label_column_stretch = value
         self.event_bus.column_width_change.emit(value)
 
     def recompute(self, var: Variable) -> None:
@@ -785,7 +1074,7 @@ class HomePage(UIPage):
 
     def on_request_focus(self, name: str) -> None:
         def task() -> None:
-            if widget := self.dialog.findChild(ui.QWidget, name):
+            if widget := self.event_bus.find_value_widget(name):
                 if self.scroll.isAncestorOf(widget):
                     self.scroll.ensureWidgetVisible(widget.parent())
                 widget.setFocus()
@@ -794,10 +1083,22 @@ class HomePage(UIPage):
 
     def create_search_box(self) -> ui.QWidget:
         with ui.Row(contentsMargins=(0, 0, 0, 0)):
-            self.search = ui.InputText(placeholderText=str(dtr("Vars", "Search...")), stretch=1)
-            self.search.textChanged.connect(self.editor.cmd_filter)
+            self.search = ui.InputText(placeholderText=_tr("Search..."), stretch=1)
+            # Debounce: rapid typing coalesces into a single filter pass
+            # instead of re-laying out every section per keystroke.
+            self._filter_timer = QTimer(self)
+            self._filter_timer.setSingleShot(True)
+            self._filter_timer.setInterval(120)
+            self._filter_timer.timeout.connect(self._apply_filter)
+            self.search.textChanged.connect(self._on_search_changed)
             return self.search
 
+    def _on_search_changed(self, _text: str) -> None:
+        self._filter_timer.start()
+
+    def _apply_filter(self) -> None:
+        self.editor.cmd_filter(self.search.text())
+
     def create_toolbar(self) -> ui.QWidget:
         editor = self.editor
         with ToolBar(stretch=False) as row:
@@ -808,22 +1109,22 @@ class HomePage(UIPage):
             )
             toolbar_button(
                 icon="file-import.svg",
-                tooltip=str(dtr("Vars", "Import variables")),
+                tooltip=_tr("Import variables"),
                 callback=editor.cmd_import,
             )
             toolbar_button(
                 icon="file-export.svg",
-                tooltip=str(dtr("Vars", "Export variables")),
+                tooltip=_tr("Export variables"),
                 callback=editor.cmd_export,
             )
             toolbar_button(
                 icon="table.svg",
-                tooltip=str(dtr("Vars", "Generate report table")),
+                tooltip=_tr("Generate report table"),
                 callback=editor.cmd_report,
             )
             toolbar_button(
                 icon="groups.svg",
-                tooltip=str(dtr("Vars", "Manage groups")),
+                tooltip=_tr("Manage groups"),
                 callback=editor.cmd_manage_groups,
             )
             self.toggle_hidden_btn()
@@ -885,7 +1186,7 @@ class HomePage(UIPage):
         else:
             icon = auto_icon
             tooltip = str(auto_tooltip)
-        self.recompute_btn.setIcon(FlatIcon(resources.icon(icon)))
+        self.recompute_btn.setIcon(_icon(icon))
         self.recompute_btn.setToolTip(tooltip)
 
 
@@ -906,19 +1207,19 @@ class VarReferencesPage(UIPage):
             with ToolBar():
                 toolbar_button(
                     icon="arrow-back.svg",
-                    tooltip=str(dtr("Vars", "Cancel")),
+                    tooltip=_tr("Cancel"),
                     callback=self.on_cancel,
                 )
 
-            with ui.GroupBox(title=str(dtr("Vars", "References"))):
-                ui.TextLabel(str(dtr("Vars", "Variable Name:")))
+            with ui.GroupBox(title=_tr("References")):
+                ui.TextLabel(_tr("Variable Name:"))
                 self.name = ui.InputText(value="", readOnly=True)
                 self.description = ui.TextLabel(
                     text="",
                     wordWrap=True,
                     styleSheet="padding: 5px;",
                 )
-                self.references = ReferencesTable(str(dtr("Vars", "Known References:")))
+                self.references = ReferencesTable(_tr("Known References:"))
             ui.Stretch(1)
 
     def set_var(self, var: Variable) -> None:
@@ -930,6 +1231,16 @@ class VarReferencesPage(UIPage):
         self.editor.event_bus.goto_home.emit()
 
 
+class _ContainsCompleter(QCompleter):
+    """Completer with popup mode and case-insensitive substring matching baked in."""
+
+    def __init__(self, combo: ui.QComboBox) -> None:
+        super().__init__(combo.model(), combo)
+        self.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        self.setFilterMode(ui.Qt.MatchFlag.MatchContains)
+        self.setCaseSensitivity(ui.Qt.CaseSensitivity.CaseInsensitive)
+
+
 class VarEditPage(UIPage):
     """View: Edit variable form page."""
 
@@ -942,6 +1253,7 @@ class VarEditPage(UIPage):
     messages: ui.QLabel
     references: ReferencesTable
     options: ui.InputTextMultilineWidget
+    _cached_groups_tuple: tuple[str, ...] | None
 
     def __init__(
         self,
@@ -949,22 +1261,30 @@ class VarEditPage(UIPage):
         parent: QObject | None = None,
     ) -> None:
         super().__init__(editor, parent)
+        self._cached_groups_tuple = None
+        self._groups_dirty = False
+        direct = ui.Qt.ConnectionType.DirectConnection
+        bus = self.event_bus
+        bus.var_created.connect(self._mark_groups_dirty, direct)
+        bus.var_edited.connect(self._mark_groups_dirty, direct)
+        bus.var_renamed.connect(self._mark_groups_dirty, direct)
+        bus.var_editor_removed.connect(self._mark_groups_dirty, direct)
         with ui.Col():
             with ToolBar():
                 toolbar_button(
                     icon="arrow-back.svg",
-                    tooltip=str(dtr("Vars", "Cancel")),
+                    tooltip=_tr("Cancel"),
                     callback=self.on_cancel,
                 )
                 toolbar_button(
                     icon="check-mark.svg",
-                    tooltip=str(dtr("Vars", "Save")),
+                    tooltip=_tr("Save"),
                     callback=self.on_save,
                 )
 
             with (
                 ui.GroupBox(
-                    title=str(dtr("Vars", "Edit variable")),
+                    title=_tr("Edit variable"),
                     contentsMargins=(0, 0, 0, 0),
                 ) as root,
                 ui.Col(contentsMargins=(0, 0, 0, 0)),
@@ -973,29 +1293,29 @@ class VarEditPage(UIPage):
             ):
                 self.root = root
                 with ui.Col():
-                    ui.TextLabel(str(dtr("Vars", "Name:")))
+                    ui.TextLabel(_tr("Name:"))
                     self.name = ui.InputText(value="", maxLength=128)
 
-                    ui.TextLabel(str(dtr("Vars", "Type:")))
+                    ui.TextLabel(_tr("Type:"))
                     self.types = ui.InputOptions(
                         get_supported_property_types(),
                         editable=True,
                         insertPolicy=ui.QComboBox.InsertPolicy.NoInsert,
                     )
 
-                    ui.TextLabel(str(dtr("Vars", "Group:")))
+                    ui.TextLabel(_tr("Group:"))
+                    self._cached_groups_tuple = tuple(get_groups())
                     self.groups = ui.InputOptions(
-                        {v: v for v in get_groups()},
+                        {v: v for v in self._cached_groups_tuple},
                         editable=True,
                         insertPolicy=ui.QComboBox.InsertPolicy.InsertAtBottom,
                     )
                     self.groups.lineEdit().setMaxLength(128)
 
-                    for completer in (self.groups.completer(), self.types.completer()):
-                        completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
-                        completer.setFilterMode(ui.Qt.MatchFlag.MatchContains)
+                    for combo in (self.groups, self.types):
+                        combo.setCompleter(_ContainsCompleter(combo))
 
-                    ui.TextLabel(str(dtr("Vars", "Description:")))
+                    ui.TextLabel(_tr("Description:"))
                     self.description = ui.InputTextMultiline(
                         value="",
                         minimumHeight=64,
@@ -1005,7 +1325,7 @@ class VarEditPage(UIPage):
                     )
 
                     with ui.Col(contentsMargins=(0, 0, 0, 0)):
-                        ui.TextLabel(str(dtr("Vars", "Options:")))
+                        ui.TextLabel(_tr("Options:"))
                         self.options = ui.InputTextMultiline(
                             value="",
                             minimumHeight=64,
@@ -1022,35 +1342,48 @@ class VarEditPage(UIPage):
                     )
 
                     self.references = ReferencesTable(
-                        str(dtr("Vars", "Known References (May Break)")),
+                        _tr("Known References (May Break)"),
                     )
 
                     ui.Stretch(1)
             self.messages = ui.TextLabel(visible=False, wordWrap=True)
 
+    def _mark_groups_dirty(self, _var: Variable | None = None) -> None:
+        self._groups_dirty = True
+
+    def _sync_groups(self) -> None:
+        """Re-walk the document groups only after a change was signaled."""
+        if not self._groups_dirty:
+            return
+        self._groups_dirty = False
+        current = tuple(get_groups())
+        if current != self._cached_groups_tuple:
+            self.groups.setOptions({v: v for v in current})
+            self._cached_groups_tuple = current
+
     def init_new(self) -> None:
         self.var = None
-        self.root.setTitle(str(dtr("Vars", "Create new variable")))
+        self.root.setTitle(_tr("Create new variable"))
         self.name.setText("")
         self.name.setEnabled(True)
         self.description.setText("")
         self.messages.setText("")
         self.messages.hide()
         self.types.setValue(preferences.default_property_type())
-        self.groups.setOptions({v: v for v in get_groups()})
+        self._sync_groups()
         self.options.setText("")
         self.references.table.parent().hide()
 
     def init_edit(self, var: Variable) -> None:
         self.var = var
-        self.root.setTitle(str(dtr("Vars", "Edit variable")))
+        self.root.setTitle(_tr("Edit variable"))
         self.name.setText(var.name)
         self.name.setEnabled(False)
         self.description.setText(var.description)
         self.types.setValue(var.var_type)
         if options := var.options:
             self.options.setText("\n".join(str(opt) for opt in options))
-        self.groups.setOptions({v: v for v in get_groups()})
+        self._sync_groups()
         self.groups.setValue(var.group)
         self.references.update(var)
         self.messages.setText("")
@@ -1103,46 +1436,147 @@ class VarEditPage(UIPage):
             return
 
 
+class ReferencesModel(QAbstractTableModel):
+    """Read-only model feeding the references view without per-cell items."""
+
+    # Rows exposed to the view per fetch: first paint stays bounded and
+    # the rest loads on demand as the user scrolls.
+    BATCH = 200
+
+    _rows: list[list[str]]
+    _loaded: int
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        """Create an empty model; rows arrive through set_rows."""
+        super().__init__(parent)
+        self._rows = []
+        self._loaded = 0
+        self._headers = (
+            _tr("Object Label"),
+            _tr("Property"),
+            _tr("Expression"),
+            _tr("Internal Name"),
+        )
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        if parent.isValid():
+            return
+        count = min(self.BATCH, len(self._rows) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(
+        self,
+        index: QModelIndex,
+        role: int = ui.Qt.ItemDataRole.DisplayRole,
+    ) -> str | None:
+        if role == ui.Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: ui.Qt.Orientation,
+        role: int = ui.Qt.ItemDataRole.DisplayRole,
+    ) -> str | None:
+        if (
+            role == ui.Qt.ItemDataRole.DisplayRole
+            and orientation == ui.Qt.Orientation.Horizontal
+        ):
+            return self._headers[section]
+        return None
+
+    def set_rows(self, rows: list[list[str]]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self._loaded = min(self.BATCH, len(rows))
+        self.endResetModel()
+
+
 class ReferencesTable:
     """View: References Table Widget."""
 
-    table: ui.TableWidget
+    table: QTableView
+    model: ReferencesModel
+    _last_refs_hash: int | None
+
+    # Shared across the rename/references/delete pages: flipping between
+    # them re-queries the same variable, so one slot keyed on the document
+    # undo state is enough to skip the rescan.
+    _cache: ClassVar[tuple[tuple, list[list[str]]] | None] = None
 
     def __init__(self, title: str) -> None:
+        self._last_refs_hash = None
         with ui.Col(contentsMargins=(0, 0, 0, 0)):
             ui.TextLabel(title)
-            self.table = ui.Table(
-                headers=[
-                    str(dtr("Vars", "Object Label")),
-                    str(dtr("Vars", "Property")),
-                    str(dtr("Vars", "Expression")),
-                    str(dtr("Vars", "Internal Name")),
-                ],
-                rows=[],
-                stretch=1,
-                minimumHeight=100,
-            )
+            self.model = ReferencesModel()
+            self.table = QTableView()
+            self.table.setModel(self.model)
+            self.table.setEditTriggers(ui.QAbstractItemView.NoEditTriggers)
+            self.table.setMinimumHeight(100)
+            hh = self.table.horizontalHeader()
+            hh.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+            hh.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+            hh.setDefaultSectionSize(120)
+            ui.place_widget(self.table, stretch=1)
 
     def update(self, var: Variable) -> bool:
-        refs = sorted(self.get_references(var), key=lambda x: x[0])
+        doc = var.document
+        key = (doc.Name, var.internal_name, doc.UndoCount, doc.RedoCount)
+        cache = ReferencesTable._cache
+        if cache and cache[0] == key:
+            refs = cache[1]
+        else:
+            refs = sorted(self.get_references(var), key=lambda x: x[0])
+            ReferencesTable._cache = (key, refs)
+        refs_hash = hash(tuple(tuple(row) for row in refs))
+        if refs_hash == self._last_refs_hash:
+            # Same rows as the last refresh: the model is already up to
+            # date, but the container may have been hidden elsewhere
+            # (init_new hides it directly), so re-apply visibility.
+            self.table.parent().setVisible(bool(refs))
+            return bool(refs)
+        self._last_refs_hash = refs_hash
         if refs:
-            self.table.setRowsData(refs)
+            self.model.set_rows(refs)
             self.table.parent().show()
-            self.table.resizeColumnsToContents()
             return True
 
         self.table.parent().hide()
-        self.table.setRowsData([])
+        self.model.set_rows([])
         return False
 
     def get_references(self, var: Variable) -> Generator[list[str], None, None]:
-        name, int_name = f"<<{var.name}>>", var.internal_name
+        search = re.compile(
+            re.escape(f"<<{var.name}>>") + "|" + re.escape(var.internal_name),
+        ).search
         for obj in var.references:
-            if obj.Name == "XVarGroup":
+            name = obj.Name
+            if name == "XVarGroup":
+                continue
+            # ExpressionEngine rebuilds its list on each attribute access,
+            # so it is read once. One search over the joined expressions
+            # rules out whole objects before the per-expression loop.
+            engine = obj.ExpressionEngine
+            if not engine or not search("\n".join(expr for _, expr in engine)):
                 continue
-            for prop, expr in obj.ExpressionEngine:
-                if name in expr or int_name in expr:
-                    yield [f"{obj.Label}", prop, expr, obj.Name]
+            label = obj.Label
+            for prop, expr in engine:
+                if search(expr):
+                    yield [label, prop, expr, name]
 
 
 class GroupItem(ui.QFrame):
@@ -1172,15 +1606,11 @@ class GroupItem(ui.QFrame):
         self.menu.setFocusPolicy(ui.Qt.FocusPolicy.NoFocus)
 
         hidden_btn = ui.QToolButton(self)
-        hidden_btn.setIcon(
-            FlatIcon(
-                resources.icon("hidden_ind.svg" if group.hidden else "visible.svg"),
-            ),
-        )
+        hidden_btn.setIcon(_icon("hidden_ind.svg" if group.hidden else "visible.svg"))
         hidden_btn.setToolButtonStyle(ui.Qt.ToolButtonStyle.ToolButtonIconOnly)
         hidden_btn.setToolTip(translate("Vars", "Toggle visibility"))
         hidden_btn.setFocusPolicy(ui.Qt.FocusPolicy.NoFocus)
-        hidden_btn.clicked.connect(self.on_toggle_visibility)
+        hidden_btn.clicked.connect(partial(self._toggle_visibility, hidden_btn))
 
         add_action(
             self.menu,
@@ -1218,14 +1648,10 @@ class GroupItem(ui.QFrame):
         layout.addWidget(self.menu)
         self.setLayout(layout)
 
-    def on_toggle_visibility(self) -> None:
+    def _toggle_visibility(self, btn: ui.QToolButton) -> None:
         group = self.group
         group.hidden = not group.hidden
-        self.sender().setIcon(
-            FlatIcon(
-                resources.icon("hidden_ind.svg" if group.hidden else "visible.svg"),
-            ),
-        )
+        btn.setIcon(_icon("hidden_ind.svg" if group.hidden else "visible.svg"))
 
     def reordered(self, delta: float) -> None:
         self.group.sort_key = self.group.sort_key + delta
@@ -1248,6 +1674,7 @@ class GroupManagementPage(UIPage):
     editors_layout: ui.QVBoxLayout
     editors: list[GroupItem]
     root: ui.QWidget
+    _prev_hidden: list[str]
 
     def __init__(
         self,
@@ -1261,16 +1688,16 @@ class GroupManagementPage(UIPage):
             with ToolBar():
                 toolbar_button(
                     icon="arrow-back.svg",
-                    tooltip=str(dtr("Vars", "Cancel")),
+                    tooltip=_tr("Cancel"),
                     callback=self.on_cancel,
                 )
                 toolbar_button(
                     icon="check-mark.svg",
-                    tooltip=str(dtr("Vars", "Apply changes")),
+                    tooltip=_tr("Apply changes"),
                     callback=self.on_apply,
                 )
 
-            with ui.GroupBox(title=str(dtr("Vars", "Manage groups"))) as root:
+            with ui.GroupBox(title=_tr("Manage groups")) as root:
                 self.root = root
                 with (
                     ui.Scroll(widgetResizable=True),
@@ -1297,19 +1724,20 @@ class GroupManagementPage(UIPage):
             editors.append(row)
             layout.addWidget(row)
 
+        self._prev_hidden = [ge.group.name for ge in editors if ge.group.hidden]
+
     def on_cancel(self) -> None:
         self.event_bus.goto_home.emit()
 
     def on_apply(self) -> None:
-        names = []
-        hidden = []
         for ge in self.editors:
             ge.apply_changes()
-            names.append(ge.group.name)
-            if ge.group.hidden:
-                hidden.append(ge.group.name)
+        names = [ge.group.name for ge in self.editors]
+        hidden = [ge.group.name for ge in self.editors if ge.group.hidden]
         self.container.reorder(names)
-        self.container.set_hidden(hidden)
+        if hidden != self._prev_hidden:
+            self.container.set_hidden(hidden)
+            self._prev_hidden = hidden
         self.event_bus.reload_vars.emit()
 
     def on_reordered(self) -> None:
@@ -1343,25 +1771,25 @@ class VarRenamePage(UIPage):
             with ToolBar():
                 toolbar_button(
                     icon="arrow-back.svg",
-                    tooltip=str(dtr("Vars", "Cancel")),
+                    tooltip=_tr("Cancel"),
                     callback=self.on_cancel,
                 )
                 toolbar_button(
                     icon="check-mark.svg",
-                    tooltip=str(dtr("Vars", "Rename")),
+                    tooltip=_tr("Rename"),
                     callback=self.on_rename,
                 )
 
-            with ui.GroupBox(title=str(dtr("Vars", "Rename variable"))):
+            with ui.GroupBox(title=_tr("Rename variable")):
                 with ui.Col():
                     self.old = ui.InputText(
                         value="",
-                        label=str(dtr("Vars", "Old name:")),
+                        label=_tr("Old name:"),
                         enabled=False,
                     )
                     self.new = ui.InputText(
                         value="",
-                        label=str(dtr("Vars", "New name:")),
+                        label=_tr("New name:"),
                     )
                     ui.TextLabel(
                         str(
@@ -1379,7 +1807,7 @@ class VarRenamePage(UIPage):
                     )
 
                     self.references = ReferencesTable(
-                        str(dtr("Vars", "Known References (Auto update)")),
+                        _tr("Known References (Auto update)"),
                     )
 
                     ui.Stretch(1)
@@ -1424,15 +1852,15 @@ class VarDeletePage(UIPage):
             with ToolBar():
                 toolbar_button(
                     icon="arrow-back.svg",
-                    tooltip=str(dtr("Vars", "Cancel")),
+                    tooltip=_tr("Cancel"),
                     callback=self.on_cancel,
                 )
 
-            with ui.GroupBox(title=str(dtr("Vars", "Delete variable"))):
+            with ui.GroupBox(title=_tr("Delete variable")):
                 with ui.Col():
                     self.name = ui.InputText(
                         value="",
-                        label=str(dtr("Vars", "Name:")),
+                        label=_tr("Name:"),
                         readOnly=True,
                     )
                     ui.TextLabel(
@@ -1446,17 +1874,17 @@ class VarDeletePage(UIPage):
                         styleSheet="padding: 5px;",
                     )
 
-                    with ui.GroupBox(title=str(dtr("Vars", "Danger zone"))), ui.Col():
+                    with ui.GroupBox(title=_tr("Danger zone")), ui.Col():
                         with ui.Row():
                             ui.TextLabel(
-                                str(dtr("Vars", "Confirm deletion:")),
+                                _tr("Confirm deletion:"),
                             )
                             self.confirm = ui.InputBoolean()
                             ui.Stretch(1)
 
                         self.button = ui.Button(
-                            label=str(dtr("Vars", "Delete")),
-                            icon=FlatIcon(resources.icon("delete.svg")),
+                            label=_tr("Delete"),
+                            icon=_icon("delete.svg"),
                             clicked=self.on_delete,
                             enabled=False,
                         )
@@ -1464,7 +1892,7 @@ class VarDeletePage(UIPage):
                         self.confirm.toggled.connect(self.button.setEnabled)
 
                     self.references = ReferencesTable(
-                        str(dtr("Vars", "Known References (Will break)")),
+                        _tr("Known References (Will break)"),
                     )
 
                     ui.Stretch(1)
@@ -1479,7 +1907,7 @@ class VarDeletePage(UIPage):
     def set_var(self, var: Variable) -> None:
         self.var = var
         self.confirm.setChecked(False)
-        self.button.setText(str(dtr("Vars", "Delete {name}")).format(name=var.name))
+        self.button.setText(_tr("Delete {name}").format(name=var.name))
         self.message.setText("")
         self.name.setText(var.name)
         self.references.update(var)
@@ -1496,12 +1924,7 @@ class VariablesEditor(QObject):
     pages: ui.QStackedLayout
     event_bus: EventBus
 
-    edit_page: VarEditPage
-    rename_page: VarRenamePage
-    references_page: VarReferencesPage
-    delete_page: VarDeletePage
     home_page: HomePage
-    groups_page: GroupManagementPage
 
     q_settings = QSettings("FreeCAD", "mnesarco-Vars")
 
@@ -1511,11 +1934,22 @@ class VariablesEditor(QObject):
         super().__init__(App.Gui.getMainWindow())
         self.setObjectName(self.QObjectName)
         self.doc = doc
+        self._pending_new_vars: list[Variable] = []
+        self._flush_pending = False
+        self._goto_home_pending = False
+        # Debounce: interactive drags fire dozens of move/resize events per
+        # second, the geometry is persisted once after the drag settles.
+        self._geom_timer = QTimer(self)
+        self._geom_timer.setSingleShot(True)
+        self._geom_timer.setInterval(200)
+        self._geom_timer.timeout.connect(self._save_geometry)
+        self._geom_timer.timeout.connect(self._refresh_row_heights)
+        self._last_dialog_width = 0
         groups = self.get_groups()
         x, y, w, h = self.get_geometry()
 
         with ui.Dialog(
-            title=str(dtr("Vars", "Variables")),
+            title=_tr("Variables"),
             styleSheet=stylesheet,
             modal=False,
             parent=App.Gui.getMainWindow(),
@@ -1527,12 +1961,10 @@ class VariablesEditor(QObject):
             self.event_bus = EventBus(self)
             with ui.Stack() as pages:
                 self.pages = pages.layout()
+                self._pages_host = pages
+                # Only the home page is needed to open the dialog, the
+                # other pages are built on first navigation.
                 self.home_page = HomePage(self, groups, dialog)
-                self.edit_page = VarEditPage(self, dialog)
-                self.rename_page = VarRenamePage(self, dialog)
-                self.references_page = VarReferencesPage(self, dialog)
-                self.delete_page = VarDeletePage(self, dialog)
-                self.groups_page = GroupManagementPage(self, dialog)
 
         if x or y:
             dialog.setGeometry(x, y, w, h)
@@ -1591,6 +2023,28 @@ class VariablesEditor(QObject):
         return max(x, 0), max(y, 0), max(w, 400), max(h, 500)
 
     def on_move_or_resize(self, _e) -> None:
+        self._geom_timer.start()
+        # A taller dialog can expose skeleton sections without scrolling.
+        self.home_page.schedule_lazy_load()
+
+    def _refresh_row_heights(self) -> None:
+        """Drop cached row heights and re-measure after a width change."""
+        if not self.dialog:
+            return
+        width = self.dialog.width()
+        if width == self._last_dialog_width:
+            return
+        self._last_dialog_width = width
+        # Word-wrapped description rows change height with the dialog
+        # width, so the heights cached by set_visibility are stale.
+        for section in self.sections:
+            for editor in section.editors.values():
+                editor.widget._cached_height = 0  # noqa: SLF001
+        self.cmd_filter()
+
+    def _save_geometry(self) -> None:
+        if not self.dialog:
+            return
         geom = self.dialog.geometry()
         self.q_settings.setValue("x", geom.left())
         self.q_settings.setValue("y", geom.top())
@@ -1599,24 +2053,40 @@ class VariablesEditor(QObject):
 
     def get_groups(self) -> list[(str, list[Variable])]:
         supported_types = get_supported_property_types()
-        visible_groups = [g for g in VarContainer(self.doc).groups() if not g.hidden]
+        # One pass over the document's variables instead of one full
+        # get_vars scan per group from VarGroup.variables().
+        buckets: dict[str, list[Variable]] = {}
+        for v in get_vars(self.doc):
+            if v.var_type in supported_types:
+                buckets.setdefault(v.group, []).append(v)
         return [
-            (g.name, [v for v in g.variables() if v.var_type in supported_types])
-            for g in visible_groups
+            (g.name, sorted(buckets.get(g.name, [])))
+            for g in VarContainer(self.doc).groups()
+            if not g.hidden
         ]
 
     def init_events(self) -> None:
+        # All emitters and receivers live in the UI thread, so DirectConnection
+        # is safe and skips Qt's auto connection-type resolution on each emit.
+        direct = ui.Qt.ConnectionType.DirectConnection
         bus = self.event_bus
-        bus.goto_edit_var.connect(self.cmd_edit_var)
-        bus.goto_rename_var.connect(self.cmd_rename_var)
-        bus.goto_home.connect(self.on_home)
-        bus.goto_var_references.connect(self.cmd_var_references)
-        bus.goto_delete_var.connect(self.cmd_delete_var)
-        bus.goto_groups.connect(self.cmd_manage_groups)
-        bus.var_created.connect(self.on_var_created)
-        bus.var_edited.connect(self.on_var_edited)
-        bus.var_editor_removed.connect(self.do_delete_var)
-        bus.filter_changed.connect(self.cmd_filter)
+        bus.goto_edit_var.connect(self.cmd_edit_var, direct)
+        bus.goto_rename_var.connect(self.cmd_rename_var, direct)
+        bus.goto_home.connect(self.on_home, direct)
+        bus.goto_var_references.connect(self.cmd_var_references, direct)
+        bus.goto_delete_var.connect(self.cmd_delete_var, direct)
+        bus.goto_groups.connect(self.cmd_manage_groups, direct)
+        bus.var_created.connect(self.on_var_created, direct)
+        bus.var_edited.connect(self.on_var_edited, direct)
+        bus.var_editor_removed.connect(self.do_delete_var, direct)
+        bus.filter_changed.connect(self.cmd_filter, direct)
+        # Emits used by the create/edit handlers, bound once instead of
+        # two attribute lookups per call.
+        self._emit_created = bus.var_created.emit
+        self._emit_edited = bus.var_edited.emit
+        self._emit_home = bus.goto_home.emit
+        self._emit_metadata_changed = bus.var_metadata_changed.emit
+        self._emit_group_will_change = bus.var_group_will_change.emit
 
     def cmd_manage_groups(self) -> None:
         self.groups_page.load_groups()
@@ -1635,25 +2105,47 @@ class VariablesEditor(QObject):
         self.switch_to_page(self.delete_page)
 
     def on_var_created(self, var: Variable) -> None:
-        for section in self.sections:
-            if section.name == var.group:
-                section.add_variable_editor(var)
-                break
-        else:
+        self._pending_new_vars.append(var)
+        if not self._flush_pending:
+            self._flush_pending = True
+            QTimer.singleShot(0, self._flush_new_vars)
+
+    def _flush_new_vars(self) -> None:
+        """Insert all pending new variables in a single layout pass."""
+        self._flush_pending = False
+        pending, self._pending_new_vars = self._pending_new_vars, []
+        if not pending:
+            return
+        focus_name = None
+        viewport = self.home_page.scroll.viewport()
+        viewport.setUpdatesEnabled(False)
+        try:
             ui.build_context().reset()
-            new_section = VarGroupSection(
-                var.group,
-                [var],
-                self.event_bus,
-                add=False,
-                parent=self.dialog,
-            )
-            self.sections.append(new_section)
-            self.sections_layout.addWidget(new_section.container)
+            for var in pending:
+                for section in self.sections:
+                    if section.name == var.group:
+                        focus_name = section.add_variable_editor(var) or focus_name
+                        break
+                else:
+                    new_section = VarGroupSection(
+                        var.group,
+                        [var],
+                        self.event_bus,
+                        add=False,
+                        parent=self.dialog,
+                    )
+                    self.sections.append(new_section)
+                    new_section.ensure_loaded()
+                    self.sections_layout.addWidget(new_section.container)
+                    first_editor = next(iter(new_section.editors.values()))
+                    focus_name = first_editor.editor.objectName()
             ui.build_context().reset()
-            ui.QApplication.instance().processEvents()
             self.sections_layout.activate()
-            self.event_bus.request_focus.emit(new_section.editors[0].editor.objectName())
+        finally:
+            viewport.setUpdatesEnabled(True)
+        if focus_name:
+            # Let the event loop apply the inserts before moving focus.
+            QTimer.singleShot(0, partial(self.event_bus.request_focus.emit, focus_name))
 
     def on_home(self) -> None:
         self.switch_to_page(self.home_page)
@@ -1664,13 +2156,27 @@ class VariablesEditor(QObject):
         self.switch_to_page(self.rename_page)
 
     def cmd_filter(self, text: str | None = None) -> None:
-        for section in self.sections:
-            section.filter(text or self.search.text(), self.home_page.show_hidden)
+        text = text or self.search.text()
+        show_hidden = self.home_page.show_hidden
+        # Suspend painting while every section re-applies heights so Qt
+        # collapses the whole pass into one repaint.
+        viewport = self.home_page.scroll.viewport()
+        viewport.setUpdatesEnabled(False)
+        try:
+            for section in self.sections:
+                section.filter(text, show_hidden)
+            # One explicit layout pass for all visibility changes instead
+            # of whatever Qt schedules per section.
+            self.sections_layout.activate()
+        finally:
+            viewport.setUpdatesEnabled(True)
+        # Collapsed sections may have pulled skeleton ones into view.
+        self.home_page.schedule_lazy_load()
 
     def cmd_import(self) -> None:
         file = ui.get_open_file(
-            caption=str(dtr("Vars", "Import variables")),
-            filter=str(dtr("Vars", "Variables files (*.fcvars)")),
+            caption=_tr("Import variables"),
+            filter=_tr("Variables files (*.fcvars)"),
         )
 
         if file and import_variables(file, self.doc):
@@ -1678,8 +2184,8 @@ class VariablesEditor(QObject):
 
     def cmd_export(self) -> None:
         file = ui.get_save_file(
-            caption=str(dtr("Vars", "Export variables")),
-            filter=str(dtr("Vars", "Variables files (*.fcvars)")),
+            caption=_tr("Export variables"),
+            filter=_tr("Variables files (*.fcvars)"),
             file=f"{self.doc.Name}.fcvars",
         )
 
@@ -1688,8 +2194,8 @@ class VariablesEditor(QObject):
 
     def cmd_report(self) -> None:
         file = ui.get_save_file(
-            caption=str(dtr("Vars", "Export variables report html")),
-            filter=str(dtr("Vars", "Html (*.html)")),
+            caption=_tr("Export variables report html"),
+            filter=_tr("Html (*.html)"),
             file=f"{self.doc.Name}.html",
         )
         if file:
@@ -1697,6 +2203,31 @@ class VariablesEditor(QObject):
 
             report_vars(file, self.doc)
 
+    def _build_page(self, cls: type[UIPage]) -> UIPage:
+        """Build the page on first navigation, inside the stack context."""
+        with ui.build_context().stack(self._pages_host):
+            return cls(self, self.dialog)
+
+    @cached_property
+    def edit_page(self) -> VarEditPage:
+        return self._build_page(VarEditPage)
+
+    @cached_property
+    def rename_page(self) -> VarRenamePage:
+        return self._build_page(VarRenamePage)
+
+    @cached_property
+    def references_page(self) -> VarReferencesPage:
+        return self._build_page(VarReferencesPage)
+
+    @cached_property
+    def delete_page(self) -> VarDeletePage:
+        return self._build_page(VarDeletePage)
+
+    @cached_property
+    def groups_page(self) -> GroupManagementPage:
+        return self._build_page(GroupManagementPage)
+
     def switch_to_page(self, page: UIPage) -> None:
         self.pages.setCurrentIndex(page.page_id)
 
@@ -1726,10 +2257,10 @@ class VariablesEditor(QObject):
                 doc=self.doc,
             )
             if var:
-                self.event_bus.var_created.emit(Variable(self.doc, name))
-                self.event_bus.goto_home.emit()
+                self._emit_created(Variable(self.doc, name))
+                self._emit_home()
             else:
-                return str(dtr("Vars", "Variable '{name}' already exists.")).format(name=name)
+                return _tr("Variable '{name}' already exists.").format(name=name)
         except Exception as e:  # noqa: BLE001
             return str(e)
         return None
@@ -1742,63 +2273,124 @@ class VariablesEditor(QObject):
         description: str,
         options: list[str] | None,
     ) -> str | None:
-        if description != var.description:
+        # Each var attribute read is a property fetch from the varset,
+        # so the current values are pulled once and diffed locally.
+        cur_type = var.var_type
+        cur_group = var.group
+        cur_desc = var.description
+        type_changed = var_type != cur_type
+        group_changed = bool(group) and group != cur_group
+        # Options feed the enumeration widget's item list, which is only
+        # built when the editor row is rebuilt, so option edits are
+        # structural too.
+        options_changed = bool(options) and options != var.options
+        # The description sub-row only exists while there is text, so a
+        # presence transition also needs the full rebuild.
+        desc_presence_changed = bool(description) != bool(cur_desc)
+        changed_structural = (
+            type_changed or group_changed or options_changed or desc_presence_changed
+        )
+
+        if description != cur_desc:
             var.description = description
 
-        if var_type != var.var_type and not var.change_var_type(var_type):
-            return str(dtr("Vars", "Failed to set variable type."))
+        if type_changed and not var.change_var_type(var_type):
+            return _tr("Failed to set variable type.")
 
-        if group and (group != var.group):
+        if group_changed:
             var.group = group
 
-        if options and (options != var.options):
+        if options_changed:
             var.options = options
 
-        self.event_bus.var_edited.emit(var)
+        if changed_structural:
+            # Type, group or options changed: the editor widget must be
+            # rebuilt in its (possibly new) section.
+            self._emit_edited(var)
+        else:
+            # Description/options only: update the editor row in place.
+            self._emit_metadata_changed(var)
+            self._emit_home()
         return None
 
     def on_var_edited(self, var: Variable) -> None:
-        self.event_bus.var_group_will_change.emit(var)
-        self.event_bus.var_created.emit(var)
-        self.event_bus.goto_home.emit()
+        self._emit_group_will_change(var)
+        self._emit_created(var)
+        self._emit_home()
+
+    def _goto_home_deferred(self) -> None:
+        """Emit goto_home once from the event loop, coalescing bursts."""
+        if self._goto_home_pending:
+            return
+        self._goto_home_pending = True
+
+        def emit_once() -> None:
+            self._goto_home_pending = False
+            self._emit_home()
+
+        QTimer.singleShot(0, emit_once)
 
     def do_rename_var(self, var: Variable, new_name: str) -> None | str:
         try:
             if var.rename(new_name):
                 self.event_bus.var_renamed.emit(var)
-                self.event_bus.goto_home.emit()
+                self._goto_home_deferred()
                 return None
-            return str(dtr("Vars", "New variable name already exists."))
+            return _tr("New variable name already exists.")
         except Exception as e:  # noqa: BLE001
             return str(e)
 
 
+_WHEEL_EVENT_INT = int(QEvent.Type.Wheel)
+_FOCUS_IN_INT = int(QEvent.Type.FocusIn)
+_FOCUS_OUT_INT = int(QEvent.Type.FocusOut)
+
+# Memoized findChildren results: editor panels are shown/hidden repeatedly
+# and their widget trees are static after build, so the recursive QObject
+# walk only needs to run once per target.
+_CHILDREN_CACHE: WeakKeyDictionary[ui.QWidget, list[ui.QWidget]] = WeakKeyDictionary()
+
+
+def _widget_children(target: ui.QWidget) -> list[ui.QWidget]:
+    children = _CHILDREN_CACHE.get(target)
+    if children is None:
+        children = _CHILDREN_CACHE[target] = target.findChildren(ui.QWidget)
+        target.destroyed.connect(lambda *_: _CHILDREN_CACHE.pop(target, None))
+    return children
+
+
 class ScrollEventFilter(QObject):
     """
     Prevents accidental changes on scroll.
     """
 
+    # Resolved once: each access is a chained enum attribute lookup.
+    _STRONG_FOCUS = ui.Qt.FocusPolicy.StrongFocus
+
     def __init__(self, parent: QObject | None = None) -> None:
         super().__init__(parent)
-
-    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
-        if event.type() == QEvent.Type.Wheel:
-            return not (isinstance(obj, ui.QWidget) and obj.hasFocus())
-        return super().eventFilter(obj, event)
+        self._targets: WeakSet[ui.QWidget] = WeakSet()
 
     def install(self, target: ui.QWidget) -> None:
-        for child in chain(target.findChildren(ui.QWidget), [target]):
-            if isinstance(child, QAbstractSpinBox):
-                child.installEventFilter(self)
-                child.setFocusPolicy(ui.Qt.FocusPolicy.StrongFocus)
-
-
-class LockEventFilter(QObject):
-    """
-    Lock input without disabling the widget.
-    """
-
-    interactive_events = frozenset((
+        guarded = _global_event_filter().scroll_guarded
+        # Typed findChildren filters at the C++ level, so no python side
+        # isinstance check is required per child.
+        spin_boxes = target.findChildren(QAbstractSpinBox)
+        if isinstance(target, QAbstractSpinBox):
+            spin_boxes.append(target)
+        strong_focus = self._STRONG_FOCUS
+        for child in spin_boxes:
+            self._targets.add(child)
+            guarded.add(child)
+            child.setFocusPolicy(strong_focus)
+
+
+# Raw int values of the interactive event types blocked by LockEventFilter.
+# Precomputed once: the filter runs on every Qt event, and hashing enum
+# wrappers there is measurable overhead.
+_LOCK_EVENT_INTS = frozenset(
+    int(t)
+    for t in (
         QEvent.Type.MouseButtonPress,
         QEvent.Type.MouseButtonRelease,
         QEvent.Type.MouseButtonDblClick,
@@ -1816,27 +2408,113 @@ class LockEventFilter(QObject):
         QEvent.Type.TouchBegin,
         QEvent.Type.TouchUpdate,
         QEvent.Type.TouchEnd,
-    ))
+    )
+)
+
+# All blocked codes are below this bound, so membership collapses to one
+# shift+mask on a precomputed int instead of a set hash per event.
+_MAX_MASKED_EVENT = 256
+_LOCK_EVENT_MASK = sum(1 << code for code in _LOCK_EVENT_INTS)
 
-    def __init__(self, parent: QObject | None = None) -> None:
-        super().__init__(parent)
+
+class _GlobalEventFilter(QObject):
+    """
+    Single application-wide event filter shared by all editors.
+
+    Qt dispatches every installed filter for every event of its target, so
+    one filter per widget multiplies dispatch cost. A single filter on the
+    QApplication with weak sets of registered widgets turns that into one
+    hash lookup per event.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.locked: WeakSet[ui.QWidget] = WeakSet()
+        self.scroll_guarded: WeakSet[ui.QWidget] = WeakSet()
+        self._focused_editor: VarEditor | None = None
 
     def eventFilter(self, obj: QObject, event: QEvent) -> bool:
-        if event.type() in LockEventFilter.interactive_events:
+        etype = int(event.type())
+        if etype < _MAX_MASKED_EVENT and (_LOCK_EVENT_MASK >> etype) & 1 and obj in self.locked:
             return True
-        return super().eventFilter(obj, event)
+        if etype == _WHEEL_EVENT_INT and obj in self.scroll_guarded:
+            return obj is not QApplication.focusWidget()
+        if etype == _FOCUS_IN_INT:
+            self._on_focus_in(obj)
+        elif etype == _FOCUS_OUT_INT:
+            self._on_focus_out(obj)
+        return False
+
+    def _on_focus_in(self, obj: QObject) -> None:
+        if not isinstance(obj, ui.QWidget):
+            return
+        editor = _find_var_editor(obj)
+        prev = self._focused_editor
+        if editor is not prev:
+            self._focused_editor = editor
+            with suppress(RuntimeError):
+                if prev is not None:
+                    prev.set_focus_style(False)
+            if editor is not None:
+                editor.set_focus_style(True)
+        if next_widget := getattr(obj, "forwardFocusTo", None):
+            next_widget.setFocus()
+
+    def _on_focus_out(self, obj: QObject) -> None:
+        # Focus left the application or was cleared: no FocusIn follows,
+        # so the highlighted frame is switched off here.
+        editor = self._focused_editor
+        if (
+            editor is not None
+            and isinstance(obj, ui.QWidget)
+            and editor is _find_var_editor(obj)
+            and QApplication.focusWidget() is None
+        ):
+            self._focused_editor = None
+            with suppress(RuntimeError):
+                editor.set_focus_style(False)
+
+
+_GLOBAL_EVENT_FILTER: _GlobalEventFilter | None = None
+
+
+def _global_event_filter() -> _GlobalEventFilter:
+    global _GLOBAL_EVENT_FILTER  # noqa: PLW0603
+    if _GLOBAL_EVENT_FILTER is None:
+        _GLOBAL_EVENT_FILTER = _GlobalEventFilter()
+        QApplication.instance().installEventFilter(_GLOBAL_EVENT_FILTER)
+    return _GLOBAL_EVENT_FILTER
+
+
+class LockEventFilter(QObject):
+    """
+    Lock input without disabling the widget.
+    """
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._targets: list[ui.QWidget] = []
+        self._installed: WeakSet[ui.QWidget] = WeakSet()
 
     def install(self, target: ui.QWidget) -> None:
-        target.installEventFilter(self)
-        for child in target.findChildren(ui.QWidget):
-            child.installEventFilter(self)
+        if target in self._installed:
+            return
+        self._installed.add(target)
+        locked = _global_event_filter().locked
+        self._targets = [target, *_widget_children(target)]
+        for child in self._targets:
+            locked.add(child)
 
     def uninstall(self, target: ui.QWidget) -> None:
-        target.removeEventFilter(self)
-        for child in target.findChildren(ui.QWidget):
-            child.removeEventFilter(self)
+        self._installed.discard(target)
+        locked = _global_event_filter().locked
+        for child in self._targets:
+            locked.discard(child)
+        self._targets = []
 
 
-_UI_CACHE = {
-    "LabelColumnStretch": 45,
-}
+# Runtime UI tuning values. Attribute access on a SimpleNamespace is
+# cheaper than the dict lookups these replaced in the editor build path.
+_UI_CACHE = SimpleNamespace(
+    label_column_stretch=45,
+)
@@ -2,26 +2,25 @@
 # (c) 2025 Frank David Martínez Muñoz. <mnesarco at gmail.com>
 
 from __future__ import annotations
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 from freecad.vars.vendor.fcapi import fcui as ui
 from typing import Any
 
-class _ThemeColorsHack(ui.QLabel):
-    def paintEvent(self, _e: ui.QPaintEvent) -> None:
-        qp = ui.QPainter()
-        qp.begin(self)
-        qp.fillRect(0, 0, 5, 10, qp.pen().color())
-        qp.end()
+if TYPE_CHECKING:
+    from PySide6.QtGui import QPalette
+
+if not TYPE_CHECKING:
+    from PySide.QtGui import QPalette
+
 
-# This is a hack to obtain the text color depending on the current stylesheet
-# There is no way to get stylesheet info directly in Qt
 def get_base_colors() -> tuple[ui.Color, ui.Color]:
-    lb = _ThemeColorsHack()
-    lb.setGeometry(0,0,10,10)
-    pixmap = ui.QPixmap(10,10)
-    lb.render(pixmap)
-    image = pixmap.toImage()
-    background = image.pixelColor(9,5)
-    color = image.pixelColor(1,5)
+    """Current theme text and background colors from the application palette."""
+    palette = ui.QApplication.instance().palette()
+    color = palette.color(QPalette.ColorRole.WindowText)
+    background = palette.color(QPalette.ColorRole.Window)
     return ui.Color(color), ui.Color(background)
 
 TEXT_COLOR, BG_COLOR = get_base_colors()
@@ -34,6 +33,16 @@ def interpolate_style_vars(template: str, variables: dict[str, Any]) -> str:
     """
     Apply the template to the vars and return the result.
     """
-    for k, v in variables.items():
-        template = template.replace(f"{{{k}}}", str(v))
-    return template
+    if not variables:
+        return template
+    return _interpolate(template, tuple(sorted((k, str(v)) for k, v in variables.items())))
+
+
+@lru_cache(maxsize=16)
+def _interpolate(template: str, items: tuple[tuple[str, str], ...]) -> str:
+    # One regex pass over the template instead of one full str.replace scan
+    # per variable. Only known keys are matched, so literal qss braces pass
+    # through untouched.
+    variables = dict(items)
+    pattern = re.compile(r"\{(" + "|".join(map(re.escape, variables)) + r")\}")
+    return pattern.sub(lambda m: variables[m.group(1)], template)
@@ -32,12 +32,16 @@ class PropertyEnumerationWidget(ui.QComboBox):
         if objectName:
             self.setObjectName(objectName)
 
-        self.currentIndexChanged.connect(self.on_index_changed)
-
-        for item in obj.getEnumerationsOfProperty(prop_name):
-            self.addItem(item, item)
+        # Populate in one batch and connect afterwards: per-item addItem
+        # emits currentIndexChanged on the first insert, writing the
+        # property back before the widget is even placed.
+        items = list(obj.getEnumerationsOfProperty(prop_name))
+        self.addItems(items)
+        for i, item in enumerate(items):
+            self.setItemData(i, item)
 
         self.setCurrentIndex(self.findData(accessor_adapter.get(obj, prop_name)))
+        self.currentIndexChanged.connect(self.on_index_changed)
 
         ui.place_widget(self, stretch=stretch)
 
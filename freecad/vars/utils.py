@@ -7,7 +7,6 @@ FreeCAD Vars: Utils.
 
 from __future__ import annotations
 import random
-import binascii
 import time
 from typing import TYPE_CHECKING
 
@@ -29,10 +28,10 @@ def get_unique_name(doc: Document, prefix: str = "XVar_") -> str:
     :param doc: The document in which the name should be unique.
     :return: A unique name
     """
+    get_object = doc.getObject
     for _ in range(10):
-        rand = binascii.hexlify(_RAND.randbytes(4)).decode("utf-8")
-        name = f"{prefix}{rand}"
-        if doc.getObject(name) is None:
+        name = f"{prefix}{_RAND.getrandbits(32):08x}"
+        if get_object(name) is None:
             return name
     msg = "Could not generate unique name"
     raise RuntimeError(msg)